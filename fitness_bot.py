@@ -1,7 +1,18 @@
 import os
+import json
+import sys
+import queue
+import logging
+import logging.handlers
 import math
+import time
 import asyncio
+import contextlib
+import itertools
 import datetime as dt
+from bisect import bisect_right
+from enum import IntEnum
+from functools import cache, lru_cache
 
 import discord
 from discord import app_commands
@@ -19,64 +30,286 @@ from discord.ext import commands, tasks  # you already have commands, just make
 load_dotenv()
 TOKEN = os.getenv("DISCORD_TOKEN")
 
+log = logging.getLogger("fitness_bot")
+
 INTENTS = discord.Intents.default()
 INTENTS.members = True
 INTENTS.message_content = True  # needed for wait_for("message")
 
+# (expires_at, utc_date, today_str, yesterday_str); expires_at is the epoch time
+# of the next UTC midnight, so the common path is one time.time() comparison
+_DAY_CACHE: tuple[float, dt.date, str, str] = (0.0, dt.date.min, "", "")
+
+def _day_cache() -> tuple[float, dt.date, str, str]:
+    global _DAY_CACHE
+    if time.time() >= _DAY_CACHE[0]:
+        d = dt.datetime.now(dt.timezone.utc).date()
+        next_midnight = dt.datetime.combine(d + dt.timedelta(days=1), dt.time(), tzinfo=dt.timezone.utc)
+        _DAY_CACHE = (
+            next_midnight.timestamp(),
+            d,
+            d.isoformat(),
+            (d - dt.timedelta(days=1)).isoformat(),
+        )
+    return _DAY_CACHE
+
+def today_date() -> dt.date:
+    return _day_cache()[1]
+
 def today_str():
-    return dt.datetime.utcnow().strftime("%Y-%m-%d")
+    return _day_cache()[2]
 
 def yesterday_str():
-    y = dt.datetime.utcnow().date() - dt.timedelta(days=1)
-    return y.strftime("%Y-%m-%d")
+    return _day_cache()[3]
 
 POINTS_VERSION = "v1.3-weekly-streaks"
-# Remember who we've already reminded today (guild_id, user_id) -> date_str
-DAILY_REMINDER_CACHE: dict[tuple[int, int], str] = {}
+# Remember who we've already reminded (guild_id, user_id) on REMINDER_DAY;
+# the set is emptied when the UTC date rolls over
+REMINDER_DAY = ""
+REMINDED_TODAY: set[tuple[int, int]] = set()
+# Background writes persisting reminder state (kept so they aren't garbage-collected)
+REMINDER_WRITES: set[asyncio.Task] = set()
+# Channel names where the once-a-day reminder is posted, and the IDs of the text
+# channels currently carrying one of those names (kept current by channel events)
+ALLOWED_REMINDER_CHANNELS = frozenset({"general", "fitness", "gym", "fit-challenge"})
+ALLOWED_CHANNEL_IDS: set[int] = set()
 
 # -----------------------
 # BOT SETUP
 # -----------------------
 
-bot = commands.Bot(command_prefix="!", intents=INTENTS)
+class FitnessBot(commands.Bot):
+    send_worker: asyncio.Task | None = None
+
+    async def setup_hook(self):
+        # Open the shared DB connection and set up the schema once, before any
+        # event can use it (on_ready re-fires whenever a gateway RESUME fails)
+        await init_db()
+        await restore_reminded_today()
+        self.send_worker = asyncio.create_task(send_queue_worker())
+
+    async def close(self):
+        # Only on shutdown; gateway reconnects keep the connection open
+        if self.send_worker is not None:
+            self.send_worker.cancel()
+        await super().close()
+        await close_db()
+
+
+bot = FitnessBot(command_prefix="!", intents=INTENTS)
 tree = bot.tree
 
 DB_PATH = "fitness_points.db"
 
+# Applied to every new connection (most of these are per-connection settings)
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Single shared connection, opened in setup_hook and reused by every DB helper
+DB: aiosqlite.Connection | None = None
+# Guards opening DB so concurrent first callers don't each open a connection
+DB_OPEN_LOCK = asyncio.Lock()
+# Serializes multi-statement write transactions on the shared connection
+DB_WRITE_LOCK = asyncio.Lock()
+
+
+async def get_db() -> aiosqlite.Connection:
+    """
+    Return the shared connection, opening it (and applying PRAGMAs) on first use.
+    """
+    global DB
+    if DB is not None:
+        return DB
+    async with DB_OPEN_LOCK:
+        if DB is None:
+            db = await aiosqlite.connect(DB_PATH, cached_statements=512)
+            # WAL lets leaderboard reads run alongside /log_* writes; with
+            # synchronous=NORMAL a commit no longer waits on an fsync
+            for pragma in DB_PRAGMAS:
+                await db.execute(pragma)
+            DB = db
+    return DB
+
+
+@contextlib.asynccontextmanager
+async def write_transaction():
+    """
+    Hold DB_WRITE_LOCK around one write transaction on the shared connection.
+    Commits on success; on any error rolls back, so a half-done write is never
+    persisted by the next writer's commit.
+    """
+    global LEADERBOARD_CACHE_VERSION
+    db = await get_db()
+    async with DB_WRITE_LOCK:
+        # Readers share this connection and can see uncommitted rows, so a
+        # leaderboard query overlapping the transaction must not be cached
+        LEADERBOARD_CACHE_VERSION += 1
+        try:
+            yield db
+            await db.commit()
+        except BaseException:
+            await db.rollback()
+            # Drop anything cached from rows that were just rolled back
+            invalidate_leaderboard_cache()
+            raise
+
+
+async def close_db():
+    global DB
+    if DB is not None:
+        await DB.close()
+        DB = None
+
+
+class Category(IntEnum):
+    """
+    Log categories, stored in logs.category as small integers.
+    Display names are the lower-cased member names.
+    """
+    STRENGTH = 1
+    CARDIO = 2
+    STEPS = 3
+    SLEEP = 4
+    PROTEIN = 5
+    SUPPLEMENTS = 6
+    WATER = 7
+    ALCOHOL = 8
+    PASTRY = 9
+    FASTFOOD = 10
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+# created_at is unix epoch milliseconds, category a Category value
+LOGS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        username TEXT NOT NULL,
+        date TEXT NOT NULL,
+        category INTEGER NOT NULL CHECK (category BETWEEN 1 AND 10),
+        value REAL NOT NULL,
+        points REAL NOT NULL,
+        created_at INTEGER NOT NULL
+    )
+"""
+
+
+async def migrate_logs(db: aiosqlite.Connection):
+    """
+    Rebuild a `logs` table created by older versions of the bot (ISO-8601 TEXT
+    created_at, TEXT category names) into the current schema, converting
+    timestamps to epoch millis and category names to Category values.
+    """
+    async with db.execute("PRAGMA table_info(logs)") as cursor:
+        column_types = {row[1]: row[2] for row in await cursor.fetchall()}
+    if column_types.get("created_at") == "INTEGER" and column_types.get("category") == "INTEGER":
+        return
+
+    category_cases = " ".join(f"WHEN '{c.label}' THEN {c.value}" for c in Category)
+
+    async with write_transaction():
+        await db.execute("BEGIN")
+        await db.execute("DROP TABLE IF EXISTS logs_new")
+        await db.execute(LOGS_TABLE_SQL.format(table="logs_new"))
+        await db.execute(
+            f"""
+            INSERT INTO logs_new (id, user_id, username, date, category, value, points, created_at)
+            SELECT
+                id, user_id, username, date,
+                CASE category {category_cases} ELSE category END,
+                value, points,
+                CASE
+                    WHEN typeof(created_at) = 'text'
+                    THEN CAST(ROUND((julianday(created_at) - 2440587.5) * 86400000) AS INTEGER)
+                    ELSE created_at
+                END
+            FROM logs
+            """
+        )
+        await db.execute("DROP TABLE logs")
+        await db.execute("ALTER TABLE logs_new RENAME TO logs")
+
 
 async def init_db():
-    async with aiosqlite.connect(DB_PATH) as db:
+    async with write_transaction() as db:
+        await db.execute(LOGS_TABLE_SQL.format(table="logs"))
+    await migrate_logs(db)
+
+    # (user_id, date) serves per-user day/streak lookups, (date) the leaderboard range scans
+    async with write_transaction():
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_user_date ON logs(user_id, date)")
+        await db.execute("CREATE INDEX IF NOT EXISTS idx_logs_date ON logs(date)")
+
+    # Running per-user, per-day point totals, kept in step with `logs` by the
+    # writers below so "total for today" is a primary-key lookup, not a SUM
+    async with db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_totals'"
+    ) as cursor:
+        has_daily_totals = await cursor.fetchone() is not None
+
+    if not has_daily_totals:
+        async with write_transaction():
+            await db.execute("BEGIN")
+            await db.execute(
+                """
+                CREATE TABLE daily_totals (
+                    user_id INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    total_pts REAL NOT NULL,
+                    PRIMARY KEY (user_id, date)
+                ) WITHOUT ROWID
+                """
+            )
+            # Backfill from existing logs
+            await db.execute(
+                """
+                INSERT INTO daily_totals (user_id, date, total_pts)
+                SELECT user_id, date, SUM(points)
+                FROM logs
+                GROUP BY user_id, date
+                """
+            )
+
+    # Who has already received today's auto-reminder, so a restart doesn't repeat it
+    async with write_transaction():
         await db.execute(
             """
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
+            CREATE TABLE IF NOT EXISTS reminders (
+                day TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
                 user_id INTEGER NOT NULL,
-                username TEXT NOT NULL,
-                date TEXT NOT NULL,
-                category TEXT NOT NULL,
-                value REAL NOT NULL,
-                points REAL NOT NULL,
-                created_at TEXT NOT NULL
-            )
+                PRIMARY KEY (day, guild_id, user_id)
+            ) WITHOUT ROWID
             """
         )
-        await db.commit()
 
 
 # -----------------------
 # POINTS LOGIC
 # -----------------------
 
+# The calculators are pure functions of small, bounded inputs, so most are memoized
+
+# Lifting and cardio minutes share a scale: <30m=0, 30m=1, 45m=1.25, 60m+=1.5
+MINUTE_THRESHOLDS = (30, 45, 60)
+MINUTE_POINTS = (0.0, 1.0, 1.25, 1.5)
+
+
+@lru_cache(maxsize=512)
 def calc_strength_points(minutes: int) -> float:
-    if minutes < 30:
-        return 0.0
-    if minutes < 45:
-        return 1.0
-    if minutes < 60:
-        return 1.25
-    return 1.5
+    return MINUTE_POINTS[bisect_right(MINUTE_THRESHOLDS, minutes)]
 
 
+@lru_cache(maxsize=512)
 def calc_cardio_points(minutes: int, steps: int | None = None) -> float:
     """
     Running / cardio / steps -> points.
@@ -90,15 +323,10 @@ def calc_cardio_points(minutes: int, steps: int | None = None) -> float:
             return 1.0
         return 1.5
 
-    if minutes < 30:
-        return 0.0
-    if minutes < 45:
-        return 1.0
-    if minutes < 60:
-        return 1.25
-    return 1.5
+    return MINUTE_POINTS[bisect_right(MINUTE_THRESHOLDS, minutes)]
 
 
+@lru_cache(maxsize=512)
 def calc_sleep_points(hours: float) -> float:
     if hours < 6:
         return 0.0
@@ -113,24 +341,28 @@ def calc_protein_points(heavy_meals: int, protein_shakes: int) -> float:
 
 
 def calc_supplement_points(vitamins: bool, creatine: bool, magnesium: bool, omega3: bool) -> float:
-    count = sum([vitamins, creatine, magnesium, omega3])
+    count = vitamins + creatine + magnesium + omega3
     return count * 0.25  # up to 1.0
 
 
+@lru_cache(maxsize=512)
 def calc_water_points(ounces: int) -> float:
     return 0.5 if ounces >= 80 else 0.0
 
 
+@lru_cache(maxsize=512)
 def calc_alcohol_penalty(drinks: int) -> float:
     if drinks < 3:
         return 0.0
     return -1.0 * (drinks // 3)
 
 
+@lru_cache(maxsize=512)
 def calc_pastry_penalty(pastries: int) -> float:
     return -1.0 * pastries
 
 
+@lru_cache(maxsize=512)
 def calc_fastfood_penalty(meals: int) -> float:
     return -1.0 * meals
 
@@ -139,13 +371,54 @@ def calc_fastfood_penalty(meals: int) -> float:
 # DB HELPERS
 # -----------------------
 
-async def add_log(user: discord.User | discord.Member, date: str, category: str, value: float, points: float):
-    async with aiosqlite.connect(DB_PATH) as db:
+# (start_date, end_date, limit) -> (cached_at, rows) for leaderboard_for_range
+LEADERBOARD_CACHE: dict[tuple[str, str, int], tuple[float, list]] = {}
+# (start_date, end_date, top_n) -> (cached_at, (description, winner_name, winner_pts))
+# for weekly_winners_summary
+WEEKLY_WINNERS_CACHE: dict[tuple[str, str, int], tuple[float, tuple[str, str, float]]] = {}
+LEADERBOARD_CACHE_TTL = 60.0
+# Bumped when a write starts and on every invalidation, so a query that
+# raced a write doesn't get cached
+LEADERBOARD_CACHE_VERSION = 0
+
+
+def invalidate_leaderboard_cache():
+    global LEADERBOARD_CACHE_VERSION
+    LEADERBOARD_CACHE_VERSION += 1
+    LEADERBOARD_CACHE.clear()
+    WEEKLY_WINNERS_CACHE.clear()
+
+
+# Hot-path statements live in constants so the identical SQL text hits
+# sqlite3's prepared-statement cache on every call
+INSERT_LOG_SQL = """
+    INSERT INTO logs (user_id, username, date, category, value, points, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+SELECT_DAILY_TOTAL_SQL = "SELECT total_pts FROM daily_totals WHERE user_id = ? AND date = ?"
+
+UPSERT_DAILY_TOTAL_SQL = """
+    INSERT INTO daily_totals (user_id, date, total_pts)
+    VALUES (?, ?, ?)
+    ON CONFLICT (user_id, date) DO UPDATE SET total_pts = total_pts + excluded.total_pts
+"""
+
+
+async def add_log_and_total(
+    user: discord.User | discord.Member,
+    date: str,
+    category: Category,
+    value: float,
+    points: float,
+) -> float:
+    """
+    Insert one log entry and return the user's new total for `date`, all in a
+    single transaction.
+    """
+    async with write_transaction() as db:
         await db.execute(
-            """
-            INSERT INTO logs (user_id, username, date, category, value, points, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
+            INSERT_LOG_SQL,
             (
                 user.id,
                 str(user),
@@ -153,92 +426,245 @@ async def add_log(user: discord.User | discord.Member, date: str, category: str,
                 category,
                 float(value),
                 float(points),
-                dt.datetime.utcnow().isoformat(),
+                time.time_ns() // 1_000_000,
             ),
         )
-        await db.commit()
+        await db.execute(UPSERT_DAILY_TOTAL_SQL, (user.id, date, float(points)))
+        async with db.execute(SELECT_DAILY_TOTAL_SQL, (user.id, date)) as cursor:
+            row = await cursor.fetchone()
+    invalidate_leaderboard_cache()
+    return row[0]
+
+
+async def add_logs(
+    user: discord.User | discord.Member,
+    date: str,
+    entries: list[tuple[Category, float, float]],
+):
+    """
+    Insert several (category, value, points) entries in one transaction.
+    """
+    if not entries:
+        return
+
+    created_at = time.time_ns() // 1_000_000
+    params = [
+        (user.id, str(user), date, category, float(value), float(points), created_at)
+        for category, value, points in entries
+    ]
+    async with write_transaction() as db:
+        await db.executemany(INSERT_LOG_SQL, params)
+        await db.execute(
+            UPSERT_DAILY_TOTAL_SQL,
+            (user.id, date, sum(float(points) for _, _, points in entries)),
+        )
+    invalidate_leaderboard_cache()
 
 
 async def daily_points_for_user(user_id: int, date: str) -> float:
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            "SELECT SUM(points) FROM logs WHERE user_id = ? AND date = ?",
-            (user_id, date),
-        ) as cursor:
-            row = await cursor.fetchone()
-            return row[0] if row and row[0] is not None else 0.0
+    db = await get_db()
+    async with db.execute(SELECT_DAILY_TOTAL_SQL, (user_id, date)) as cursor:
+        row = await cursor.fetchone()
+        return row[0] if row and row[0] is not None else 0.0
 
 
 async def daily_breakdown_for_user(user_id: int, date: str):
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            """
-            SELECT category, SUM(points) 
-            FROM logs 
-            WHERE user_id = ? AND date = ?
-            GROUP BY category
-            ORDER BY category
-            """,
-            (user_id, date),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return rows
+    db = await get_db()
+    async with db.execute(
+        """
+        SELECT category, SUM(points)
+        FROM logs
+        WHERE user_id = ? AND date = ?
+        GROUP BY category
+        """,
+        (user_id, date),
+    ) as cursor:
+        rows = await cursor.fetchall()
+    # At most one row per category, so sorting here is cheaper than ORDER BY
+    return sorted((Category(category).label, pts) for category, pts in rows)
 
 
 async def leaderboard_for_range(start_date: str, end_date: str, limit: int = 10):
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            """
-            SELECT user_id, username, SUM(points) AS total_pts
-            FROM logs
-            WHERE date BETWEEN ? AND ?
-            GROUP BY user_id, username
-            ORDER BY total_pts DESC
-            LIMIT ?
-            """,
-            (start_date, end_date, limit),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return rows
+    key = (start_date, end_date, limit)
+    now = time.monotonic()
+    cached = LEADERBOARD_CACHE.get(key)
+    if cached is not None and now - cached[0] < LEADERBOARD_CACHE_TTL:
+        return cached[1]
+
+    version = LEADERBOARD_CACHE_VERSION
+    db = await get_db()
+    async with db.execute(
+        """
+        SELECT user_id, username, SUM(points) AS total_pts
+        FROM logs
+        WHERE date BETWEEN ? AND ?
+        GROUP BY user_id, username
+        ORDER BY total_pts DESC
+        LIMIT ?
+        """,
+        (start_date, end_date, limit),
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    if version == LEADERBOARD_CACHE_VERSION:
+        LEADERBOARD_CACHE[key] = (now, rows)
+    return rows
 
 
 async def weekly_totals_for_user(user_id: int, start_date: str, end_date: str):
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            """
-            SELECT date, SUM(points) AS total_pts
-            FROM logs
-            WHERE user_id = ? AND date BETWEEN ? AND ?
-            GROUP BY date
-            ORDER BY date
-            """,
-            (user_id, start_date, end_date),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return rows
+    db = await get_db()
+    async with db.execute(
+        """
+        SELECT date, total_pts
+        FROM daily_totals
+        WHERE user_id = ? AND date BETWEEN ? AND ?
+        ORDER BY date
+        """,
+        (user_id, start_date, end_date),
+    ) as cursor:
+        rows = await cursor.fetchall()
+        return rows
+
+
+async def daily_totals_for_users(user_ids: list[int], start_date: str, end_date: str):
+    """
+    Per-day totals for several users in one query: list of (user_id, date, total_pts).
+    """
+    if not user_ids:
+        return []
+
+    placeholders = ", ".join("?" for _ in user_ids)
+    db = await get_db()
+    async with db.execute(
+        f"""
+        SELECT user_id, date, total_pts
+        FROM daily_totals
+        WHERE user_id IN ({placeholders}) AND date BETWEEN ? AND ?
+        """,
+        (*user_ids, start_date, end_date),
+    ) as cursor:
+        rows = await cursor.fetchall()
+        return rows
+
+
+async def reminded_on(day: str) -> set[tuple[int, int]]:
+    """
+    (guild_id, user_id) pairs that were sent the auto-reminder on `day`.
+    """
+    db = await get_db()
+    async with db.execute(
+        "SELECT guild_id, user_id FROM reminders WHERE day = ?",
+        (day,),
+    ) as cursor:
+        rows = await cursor.fetchall()
+        return {(guild_id, user_id) for guild_id, user_id in rows}
+
+
+async def mark_reminded(day: str, guild_id: int, user_id: int):
+    async with write_transaction() as db:
+        await db.execute(
+            "INSERT OR IGNORE INTO reminders (day, guild_id, user_id) VALUES (?, ?, ?)",
+            (day, guild_id, user_id),
+        )
+
+
+async def delete_reminders_before(day: str):
+    async with write_transaction() as db:
+        await db.execute("DELETE FROM reminders WHERE day < ?", (day,))
+
+
+def _reminder_write_done(task: asyncio.Task):
+    REMINDER_WRITES.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.warning("Failed to persist reminder state: %s", task.exception())
+
+
+def spawn_reminder_write(coro):
+    """
+    Run a reminders-table write in the background; a failure is only logged,
+    so it never holds up or cancels the reminder itself.
+    """
+    task = asyncio.create_task(coro)
+    REMINDER_WRITES.add(task)
+    task.add_done_callback(_reminder_write_done)
+
+
+async def restore_reminded_today():
+    """
+    Reload today's reminded users at startup so a restart doesn't remind them
+    again. Merged rather than replaced: the in-memory set is authoritative once
+    the bot is running.
+    """
+    global REMINDER_DAY
+    day = today_str()
+    await delete_reminders_before(day)
+    loaded = await reminded_on(day)
+    if day != REMINDER_DAY:
+        REMINDER_DAY = day
+        REMINDED_TODAY.clear()
+    REMINDED_TODAY.update(loaded)
 
 
 # -----------------------
 # STREAK HELPERS
 # -----------------------
 
+# Badge for a streak of at least BADGE_THRESHOLDS[i] days is BADGE_LABELS[i + 1]
+BADGE_THRESHOLDS = (3, 5, 7, 14, 21, 30)
+BADGE_LABELS = (
+    "✨ No badge yet — keep going!",
+    "🔥 3-Day Spark",
+    "💪 5-Day Grinder",
+    "🏅 7-Day Warrior",
+    "🐉 14-Day Beast",
+    "👑 21-Day Monarch",
+    "🚀 30-Day Legend",
+)
+
+
+@lru_cache(maxsize=512)
 def streak_badge(streak: int) -> str:
     """
     Returns a text badge for a given streak length.
     """
-    if streak >= 30:
-        return "🚀 30-Day Legend"
-    if streak >= 21:
-        return "👑 21-Day Monarch"
-    if streak >= 14:
-        return "🐉 14-Day Beast"
-    if streak >= 7:
-        return "🏅 7-Day Warrior"
-    if streak >= 5:
-        return "💪 5-Day Grinder"
-    if streak >= 3:
-        return "🔥 3-Day Spark"
-    return "✨ No badge yet — keep going!"
+    return BADGE_LABELS[bisect_right(BADGE_THRESHOLDS, streak)]
+
+
+def streaks_from_totals(
+    rows,
+    end: dt.date,
+    threshold: float,
+    max_days: int,
+):
+    """
+    Current and best streak over the max_days ending at `end`, given
+    (date_str, total_pts) rows.
+    """
+    # totals_by_offset[0] is `end`, totals_by_offset[1] the day before, ...
+    end_ord = end.toordinal()
+    totals_by_offset = [0.0] * max_days
+    for date_str, pts in rows:
+        offset = end_ord - dt.date.fromisoformat(date_str).toordinal()
+        if 0 <= offset < max_days:
+            totals_by_offset[offset] = pts
+
+    # One pass backward from today: the current streak is the first run
+    # (it only grows while it still reaches back to offset 0), the best
+    # streak is the longest run anywhere in the window
+    current_streak = 0
+    best_streak = 0
+    running = 0
+    for offset, pts in enumerate(totals_by_offset):
+        if pts >= threshold:
+            running += 1
+            if running > best_streak:
+                best_streak = running
+            if current_streak == offset:
+                current_streak += 1
+        else:
+            running = 0
+
+    return current_streak, best_streak
 
 
 async def current_and_best_streak_for_user(
@@ -250,41 +676,40 @@ async def current_and_best_streak_for_user(
     Compute current streak and best streak over the last max_days, where a 'good day'
     is any day with total points >= threshold.
     """
-    end = dt.datetime.utcnow().date()
+    end = today_date()
     start = end - dt.timedelta(days=max_days - 1)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
+    start_str = start.isoformat()
+    end_str = end.isoformat()
 
-    rows = await weekly_totals_for_user(user_id, start_str, end_str)
     # rows: list of (date_str, total_pts)
-    totals_map = {date_str: pts for (date_str, pts) in rows}
+    rows = await weekly_totals_for_user(user_id, start_str, end_str)
 
-    # current streak: count backward from today until a break
-    current_streak = 0
-    for offset in range(max_days):
-        d = end - dt.timedelta(days=offset)
-        ds = d.strftime("%Y-%m-%d")
-        pts = totals_map.get(ds, 0.0)
-        if pts >= threshold:
-            current_streak += 1
-        else:
-            break
+    return streaks_from_totals(rows, end, threshold, max_days)
 
-    # best streak over whole window
-    best_streak = 0
-    running = 0
-    for offset in range(max_days):
-        d = start + dt.timedelta(days=offset)
-        ds = d.strftime("%Y-%m-%d")
-        pts = totals_map.get(ds, 0.0)
-        if pts >= threshold:
-            running += 1
-            if running > best_streak:
-                best_streak = running
-        else:
-            running = 0
 
-    return current_streak, best_streak
+async def current_and_best_streaks_for_users(
+    user_ids: list[int],
+    threshold: float = 4.0,
+    max_days: int = 90,
+) -> dict[int, tuple[int, int]]:
+    """
+    Same as current_and_best_streak_for_user, for several users with a single
+    query. Returns user_id -> (current_streak, best_streak).
+    """
+    end = today_date()
+    start = end - dt.timedelta(days=max_days - 1)
+    start_str = start.isoformat()
+    end_str = end.isoformat()
+
+    rows = await daily_totals_for_users(user_ids, start_str, end_str)
+    totals_by_user: dict[int, list[tuple[str, float]]] = {user_id: [] for user_id in user_ids}
+    for user_id, date_str, pts in rows:
+        totals_by_user[user_id].append((date_str, pts))
+
+    return {
+        user_id: streaks_from_totals(user_rows, end, threshold, max_days)
+        for user_id, user_rows in totals_by_user.items()
+    }
 
 
 # -----------------------
@@ -293,24 +718,34 @@ async def current_and_best_streak_for_user(
 
 @bot.event
 async def on_ready():
-    await init_db()
+    # Sync commands per guild so new ones (like /quote) show up immediately;
+    # the syncs run concurrently and discord.py's rate limiter paces them
+    guilds = list(bot.guilds)
+    results = await asyncio.gather(
+        *(tree.sync(guild=guild) for guild in guilds),
+        return_exceptions=True,
+    )
+    cmd_names = [cmd.name for cmd in tree.get_commands()]
+    for guild, result in zip(guilds, results):
+        if isinstance(result, Exception):
+            log.warning("Error syncing commands for guild %s (%s): %s", guild.name, guild.id, result)
+        else:
+            log.info("Synced commands to guild %s (%s): %s", guild.name, guild.id, cmd_names)
 
-    # Sync commands per guild so new ones (like /quote) show up immediately
+    # Members and channels may have changed while we were disconnected
+    ALLOWED_CHANNEL_IDS.clear()
     for guild in bot.guilds:
-        try:
-            await tree.sync(guild=guild)
-            cmd_names = [cmd.name for cmd in tree.get_commands()]
-            print(f"Synced commands to guild {guild.name} ({guild.id}): {cmd_names}")
-        except Exception as e:
-            print(f"Error syncing commands for guild {guild.name} ({guild.id}): {e}")
+        refresh_humans_cache(guild)
+        refresh_sendable_channels(guild)
+        for channel in guild.text_channels:
+            track_reminder_channel(channel)
 
-    print(f"Logged in as {bot.user} (ID: {bot.user.id})")
-    print(f"Points logic version: {POINTS_VERSION}")
+    log.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
+    log.info("Points logic version: %s", POINTS_VERSION)
 
     if not daily_drops_task.is_running():
         daily_drops_task.start()
-        print("Started daily_drops_task.")
-
+        log.info("Started daily_drops_task.")
 
 
 
@@ -318,6 +753,8 @@ async def on_ready():
 # HELPER: ASK / WAIT FOR INPUT
 # -----------------------
 
+YESNO_ANSWERS = {"y": True, "yes": True, "n": False, "no": False}
+
 async def ask_number(
     interaction: discord.Interaction,
     prompt: str,
@@ -344,13 +781,13 @@ async def ask_number(
             await channel.send(f"{user.mention} timed out, using default `{default}`.")
             return default
 
-        content = msg.content.strip().lower()
-        if content == "skip":
-            return default
-
+        # Numbers have no case, so only lower-case replies that aren't one
+        content = msg.content.strip()
         try:
             val = float(content) if allow_float else int(content)
         except ValueError:
+            if content.lower() == "skip":
+                return default
             await channel.send("Please enter a valid number or `skip`.")
             continue
 
@@ -383,13 +820,15 @@ async def ask_yesno(interaction: discord.Interaction, prompt: str, default: bool
             await channel.send(f"{user.mention} timed out, using default `{default_str}`.")
             return default
 
-        content = msg.content.strip().lower()
-        if content == "skip":
-            return default
-        if content in ("y", "yes"):
-            return True
-        if content in ("n", "no"):
-            return False
+        # Every accepted reply is at most 4 characters; don't lower-case anything longer
+        content = msg.content.strip()
+        if len(content) <= 4:
+            content = content.lower()
+            if content == "skip":
+                return default
+            answer = YESNO_ANSWERS.get(content)
+            if answer is not None:
+                return answer
 
         await channel.send("Please reply with `yes`, `no`, or `skip`.")
 
@@ -405,6 +844,9 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     """
     user = interaction.user
     channel = interaction.channel
+    # Buffered (category, value, points), written in one transaction at the end.
+    # Answers that score 0 points are not stored.
+    pending: list[tuple[Category, float, float]] = []
 
     # Lifting
     lift_min = await ask_number(
@@ -417,7 +859,8 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if lift_min > 0:
         pts = calc_strength_points(int(lift_min))
-        await add_log(user, date, "strength", lift_min, pts)
+        if pts != 0:
+            pending.append((Category.STRENGTH, lift_min, pts))
 
     # Cardio minutes
     cardio_min = await ask_number(
@@ -443,10 +886,12 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     # cardio/steps logging
     if steps > 0:
         pts_steps = calc_cardio_points(minutes=0, steps=int(steps))
-        await add_log(user, date, "steps", steps, pts_steps)
+        if pts_steps != 0:
+            pending.append((Category.STEPS, steps, pts_steps))
     if cardio_min > 0:
         pts_cardio = calc_cardio_points(minutes=int(cardio_min), steps=None)
-        await add_log(user, date, "cardio", cardio_min, pts_cardio)
+        if pts_cardio != 0:
+            pending.append((Category.CARDIO, cardio_min, pts_cardio))
 
     # Sleep
     sleep_hours = await ask_number(
@@ -459,7 +904,8 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if sleep_hours > 0:
         pts_sleep = calc_sleep_points(float(sleep_hours))
-        await add_log(user, date, "sleep", sleep_hours, pts_sleep)
+        if pts_sleep != 0:
+            pending.append((Category.SLEEP, sleep_hours, pts_sleep))
 
     # Protein
     heavy_meals = await ask_number(
@@ -481,17 +927,17 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if heavy_meals > 0 or shakes > 0:
         pts_protein = calc_protein_points(int(heavy_meals), int(shakes))
-        await add_log(user, date, "protein", heavy_meals + shakes, pts_protein)
+        pending.append((Category.PROTEIN, heavy_meals + shakes, pts_protein))
 
     # Supplements
     vitamins = await ask_yesno(interaction, f"For **{label}**, did you take your **vitamin**?", default=False)
     creatine = await ask_yesno(interaction, f"For **{label}**, did you take **creatine**?", default=False)
     magnesium = await ask_yesno(interaction, f"For **{label}**, did you take **magnesium**?", default=False)
     omega3 = await ask_yesno(interaction, f"For **{label}**, did you take **omega-3**?", default=False)
-    if any([vitamins, creatine, magnesium, omega3]):
+    count = vitamins + creatine + magnesium + omega3
+    if count:
         pts_supp = calc_supplement_points(vitamins, creatine, magnesium, omega3)
-        count = sum([vitamins, creatine, magnesium, omega3])
-        await add_log(user, date, "supplements", count, pts_supp)
+        pending.append((Category.SUPPLEMENTS, count, pts_supp))
 
     # Water
     water_oz = await ask_number(
@@ -504,7 +950,8 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if water_oz > 0:
         pts_water = calc_water_points(int(water_oz))
-        await add_log(user, date, "water", water_oz, pts_water)
+        if pts_water != 0:
+            pending.append((Category.WATER, water_oz, pts_water))
 
     # Alcohol
     drinks = await ask_number(
@@ -517,7 +964,8 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if drinks > 0:
         pts_alc = calc_alcohol_penalty(int(drinks))
-        await add_log(user, date, "alcohol", drinks, pts_alc)
+        if pts_alc != 0:
+            pending.append((Category.ALCOHOL, drinks, pts_alc))
 
     # Pastries
     pastries = await ask_number(
@@ -530,7 +978,7 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if pastries > 0:
         pts_pastry = calc_pastry_penalty(int(pastries))
-        await add_log(user, date, "pastry", pastries, pts_pastry)
+        pending.append((Category.PASTRY, pastries, pts_pastry))
 
     # Fast food
     fast_meals = await ask_number(
@@ -543,7 +991,9 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
     )
     if fast_meals > 0:
         pts_ff = calc_fastfood_penalty(int(fast_meals))
-        await add_log(user, date, "fastfood", fast_meals, pts_ff)
+        pending.append((Category.FASTFOOD, fast_meals, pts_ff))
+
+    await add_logs(user, date, pending)
 
     # Final summary
     total = await daily_points_for_user(user.id, date)
@@ -568,8 +1018,7 @@ async def run_checkin_dialog(interaction: discord.Interaction, date: str, label:
 )
 async def log_lift(interaction: discord.Interaction, minutes: app_commands.Range[int, 1, 300]):
     pts = calc_strength_points(minutes)
-    await add_log(interaction.user, today_str(), "strength", minutes, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.STRENGTH, minutes, pts)
 
     await interaction.response.send_message(
         f"💪 Logged **{minutes} min** of lifting for **{pts:.2f} pts**.\n"
@@ -583,8 +1032,7 @@ async def log_lift(interaction: discord.Interaction, minutes: app_commands.Range
 )
 async def log_run(interaction: discord.Interaction, minutes: app_commands.Range[int, 1, 300]):
     pts = calc_cardio_points(minutes, steps=None)
-    await add_log(interaction.user, today_str(), "cardio", minutes, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.CARDIO, minutes, pts)
 
     await interaction.response.send_message(
         f"🏃 Logged **{minutes} min** of cardio for **{pts:.2f} pts**.\n"
@@ -598,8 +1046,7 @@ async def log_run(interaction: discord.Interaction, minutes: app_commands.Range[
 )
 async def log_steps(interaction: discord.Interaction, steps: app_commands.Range[int, 1, 100_000]):
     pts = calc_cardio_points(minutes=0, steps=steps)
-    await add_log(interaction.user, today_str(), "steps", steps, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.STEPS, steps, pts)
 
     await interaction.response.send_message(
         f"👣 Logged **{steps} steps** for **{pts:.2f} pts**.\n"
@@ -613,8 +1060,7 @@ async def log_steps(interaction: discord.Interaction, steps: app_commands.Range[
 )
 async def log_sleep(interaction: discord.Interaction, hours: app_commands.Range[float, 0.0, 16.0]):
     pts = calc_sleep_points(hours)
-    await add_log(interaction.user, today_str(), "sleep", hours, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.SLEEP, hours, pts)
 
     await interaction.response.send_message(
         f"😴 Logged **{hours:.1f} hours** of sleep for **{pts:.2f} pts**.\n"
@@ -633,8 +1079,7 @@ async def log_protein(
     shakes: app_commands.Range[int, 0, 10]
 ):
     pts = calc_protein_points(heavy_meals, shakes)
-    await add_log(interaction.user, today_str(), "protein", heavy_meals + shakes, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.PROTEIN, heavy_meals + shakes, pts)
 
     await interaction.response.send_message(
         f"🍗 Logged **{heavy_meals} heavy meals** and **{shakes} shakes** "
@@ -658,9 +1103,8 @@ async def log_supplements(
     omega3: bool
 ):
     pts = calc_supplement_points(vitamins, creatine, magnesium, omega3)
-    count = sum([vitamins, creatine, magnesium, omega3])
-    await add_log(interaction.user, today_str(), "supplements", count, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    count = vitamins + creatine + magnesium + omega3
+    total = await add_log_and_total(interaction.user, today_str(), Category.SUPPLEMENTS, count, pts)
 
     await interaction.response.send_message(
         f"💊 Logged **{count}** supplements for **{pts:.2f} pts**.\n"
@@ -674,8 +1118,7 @@ async def log_supplements(
 )
 async def log_water(interaction: discord.Interaction, ounces: app_commands.Range[int, 0, 300]):
     pts = calc_water_points(ounces)
-    await add_log(interaction.user, today_str(), "water", ounces, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.WATER, ounces, pts)
 
     await interaction.response.send_message(
         f"💧 Logged **{ounces} oz** of water for **{pts:.2f} pts**.\n"
@@ -689,8 +1132,7 @@ async def log_water(interaction: discord.Interaction, ounces: app_commands.Range
 )
 async def log_alcohol(interaction: discord.Interaction, drinks: app_commands.Range[int, 0, 30]):
     pts = calc_alcohol_penalty(drinks)
-    await add_log(interaction.user, today_str(), "alcohol", drinks, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.ALCOHOL, drinks, pts)
 
     await interaction.response.send_message(
         f"🍺 Logged **{drinks} drinks** for **{pts:.2f} pts** (negative is bad 😈).\n"
@@ -704,8 +1146,7 @@ async def log_alcohol(interaction: discord.Interaction, drinks: app_commands.Ran
 )
 async def log_pastry(interaction: discord.Interaction, count: app_commands.Range[int, 0, 20]):
     pts = calc_pastry_penalty(count)
-    await add_log(interaction.user, today_str(), "pastry", count, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.PASTRY, count, pts)
 
     await interaction.response.send_message(
         f"🥐 Logged **{count} pastries** for **{pts:.2f} pts** (negative).\n"
@@ -719,8 +1160,7 @@ async def log_pastry(interaction: discord.Interaction, count: app_commands.Range
 )
 async def log_fastfood(interaction: discord.Interaction, meals: app_commands.Range[int, 0, 10]):
     pts = calc_fastfood_penalty(meals)
-    await add_log(interaction.user, today_str(), "fastfood", meals, pts)
-    total = await daily_points_for_user(interaction.user.id, today_str())
+    total = await add_log_and_total(interaction.user, today_str(), Category.FASTFOOD, meals, pts)
 
     await interaction.response.send_message(
         f"🍟 Logged **{meals} fast-food meals** for **{pts:.2f} pts** (negative).\n"
@@ -755,10 +1195,10 @@ async def daily_summary(interaction: discord.Interaction):
     days="How many days back from today? (Default 7)"
 )
 async def leaderboard_cmd(interaction: discord.Interaction, days: app_commands.Range[int, 1, 90] = 7):
-    end = dt.datetime.utcnow().date()
+    end = today_date()
     start = end - dt.timedelta(days=days - 1)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
+    start_str = start.isoformat()
+    end_str = end.isoformat()
 
     rows = await leaderboard_for_range(start_str, end_str, limit=10)
 
@@ -766,10 +1206,12 @@ async def leaderboard_cmd(interaction: discord.Interaction, days: app_commands.R
         await interaction.response.send_message("No logs found in that period.")
         return
 
+    # current streak for each leaderboard user (optional but fun), fetched in one query
+    streaks = await current_and_best_streaks_for_users([user_id for user_id, _, _ in rows])
+
     desc_lines = []
     for rank, (user_id, username, total_pts) in enumerate(rows, start=1):
-        # get current streak for each leaderboard user (optional but fun)
-        curr_streak, _ = await current_and_best_streak_for_user(user_id)
+        curr_streak, _ = streaks[user_id]
         badge = streak_badge(curr_streak) if curr_streak > 0 else "✨"
         desc_lines.append(
             f"**{rank}.** {username} — `{total_pts:.2f} pts` "
@@ -851,10 +1293,10 @@ async def yesterday_checkin(interaction: discord.Interaction):
     days="How many days back from today? (Default 7, max 30)"
 )
 async def week_summary(interaction: discord.Interaction, days: app_commands.Range[int, 1, 30] = 7):
-    end = dt.datetime.utcnow().date()
+    end = today_date()
     start = end - dt.timedelta(days=days - 1)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
+    start_str = start.isoformat()
+    end_str = end.isoformat()
 
     rows = await weekly_totals_for_user(interaction.user.id, start_str, end_str)
 
@@ -901,6 +1343,46 @@ async def streak_cmd(interaction: discord.Interaction):
 # WEEKLY WINNERS
 # -----------------------
 
+WINNER_LINE_FMT = "**#{rank}** {username} — `{pts:.2f} pts` (streak: {cs}d, best: {bs}d, {badge})"
+
+
+async def weekly_winners_summary(start_str: str, end_str: str, top_n: int):
+    """
+    (description, winner_name, winner_pts) for the weekly winners embed, or
+    None if nobody logged anything in the range. Cached like the leaderboard.
+    """
+    key = (start_str, end_str, top_n)
+    now = time.monotonic()
+    cached = WEEKLY_WINNERS_CACHE.get(key)
+    if cached is not None and now - cached[0] < LEADERBOARD_CACHE_TTL:
+        return cached[1]
+
+    version = LEADERBOARD_CACHE_VERSION
+    rows = await leaderboard_for_range(start_str, end_str, limit=top_n)
+    if not rows:
+        return None
+
+    streaks = await current_and_best_streaks_for_users([user_id for user_id, _, _ in rows])
+
+    description = "\n".join(
+        WINNER_LINE_FMT.format(
+            rank=rank,
+            username=username,
+            pts=total_pts,
+            cs=streaks[user_id][0],
+            bs=streaks[user_id][1],
+            badge=streak_badge(streaks[user_id][0]),
+        )
+        for rank, (user_id, username, total_pts) in enumerate(rows, start=1)
+    )
+    _, winner_name, winner_pts = rows[0]
+
+    summary = (description, winner_name, winner_pts)
+    if version == LEADERBOARD_CACHE_VERSION:
+        WEEKLY_WINNERS_CACHE[key] = (now, summary)
+    return summary
+
+
 @tree.command(name="weekly_winners", description="Announce weekly winners for the last N days (default 7).")
 @app_commands.describe(
     days="How many days back from today? (Default 7, max 30)",
@@ -911,37 +1393,21 @@ async def weekly_winners(
     days: app_commands.Range[int, 1, 30] = 7,
     top_n: app_commands.Range[int, 1, 10] = 3
 ):
-    end = dt.datetime.utcnow().date()
+    end = today_date()
     start = end - dt.timedelta(days=days - 1)
-    start_str = start.strftime("%Y-%m-%d")
-    end_str = end.strftime("%Y-%m-%d")
+    start_str = start.isoformat()
+    end_str = end.isoformat()
 
-    rows = await leaderboard_for_range(start_str, end_str, limit=top_n)
+    summary = await weekly_winners_summary(start_str, end_str, top_n)
 
-    if not rows:
+    if summary is None:
         await interaction.response.send_message(
             f"No logs found between **{start_str}** and **{end_str}**."
         )
         return
 
-    desc_lines = []
-    winner_name = None
-    winner_pts = None
-
-    for rank, (user_id, username, total_pts) in enumerate(rows, start=1):
-        if rank == 1:
-            winner_name = username
-            winner_pts = total_pts
-
-        curr_streak, best_streak = await current_and_best_streak_for_user(user_id)
-        badge = streak_badge(curr_streak)
-        desc_lines.append(
-            f"**#{rank}** {username} — `{total_pts:.2f} pts` "
-            f"(streak: {curr_streak}d, best: {best_streak}d, {badge})"
-        )
-
+    description, winner_name, winner_pts = summary
     title = f"🏆 Weekly Winners ({start_str} → {end_str})"
-    description = "\n".join(desc_lines)
 
     embed = discord.Embed(
         title=title,
@@ -967,233 +1433,49 @@ async def weekly_winners(
 
 import random
 
-# 20 general motivation quotes
-GENERAL_QUOTES = [
-    "LFG!!! New day, new chance to not be mid. 💥",
-    "You don’t need a mood, you need a mission. Get after it. 🎯",
-    "Discipline is doing it when you don’t feel like it — and you don’t feel like it a LOT. Do it anyway.",
-    "You’re one decision away from a completely different life. Make the hard one.",
-    "Your future self is watching you right now, judging. Make them proud.",
-    "Comfort is the enemy. Get uncomfortable, get better.",
-    "If you’re waiting to ‘feel ready’, you’ll wait forever. Start dirty, fix it live.",
-    "You either make progress or make excuses. Same energy, different results.",
-    "Losers wait for motivation. Winners show up out of habit.",
-    "Your problems won’t get lighter. You need to get stronger.",
-    "Every time you don’t quit, you just insult your old lazy self. Keep insulting them.",
-    "You’re not behind. You’re just earlier in the storyline. Keep grinding.",
-    "Tired? Good. That’s the tax you pay for improvement.",
-    "When you think you’re done, you’re probably at 40%. Push past it.",
-    "If it scares you and it’s good for you — that’s exactly what you should be doing.",
-    "You don’t rise to the level of your goals. You fall to the level of your systems.",
-    "Success is just boredom done consistently. Boring work, legendary results.",
-    "You’re not fragile. You’ve survived every bad day so far. Keep going.",
-    "Talk less about the grind, grind more so people talk about you.",
-    "You are building a version of you that your enemies will fear. Stay at it.",
-]
-
-# 30 fitness motivation quotes
-FITNESS_QUOTES = [
-    "Get your ass under the bar today. No excuses. 💪",
-    "LET’S GET THIS BREAD 🍞 and then burn it off.",
-    "Stop scrolling. Start lifting. The weights are waiting.",
-    "Pain is temporary, looking powerful is a long-term investment.",
-    "Sweat now, flex later. The pump is your signature.",
-    "No one cares how tired you are. Hit the set.",
-    "You don’t need motivation; you need a scheduled workout.",
-    "Your gym membership doesn’t get you results. Showing up does.",
-    "Your body is voting with every rep. Vote for strength.",
-    "Cardio doesn’t kill gains. Skipping cardio kills your lungs.",
-    "Every rep is a receipt that you were here and you worked.",
-    "You can’t out-talk a bad physique. Train.",
-    "Progress pics > excuses. Take both, compare.",
-    "Your warm-up is someone else’s max. Respect it and get better.",
-    "You won’t remember being tired. You will remember quitting.",
-    "If you still look cute at the end, you didn’t work hard enough.",
-    "Leg day builds humility and domination at the same time.",
-    "You don’t ‘find’ time to train. You steal it from weaker versions of yourself.",
-    "Slow progress is still progress. Fast excuses are still excuses.",
-    "The iron is honest. It doesn’t care who you are, only what you do.",
-    "No magical program beats ‘show up 4–6 days a week’ for a year.",
-    "A bad workout is better than the perfect workout you never did.",
-    "The first set is negotiation. The last set is war.",
-    "You’re one hard month away from being unrecognizable. Start the month.",
-    "Stop saying ‘I’ll start Monday’. Today is a perfectly good day to suffer.",
-    "Muscle doesn’t grow from comfort. It grows from ‘damn, that was heavy.’",
-    "You’re not too old, too busy, or too tired. You’re under-trained.",
-    "You’re building armor. Not just for your body, for your life.",
-    "Your workout is therapy with receipts. Pay the bill.",
-    "Be the strongest one in your friend group. Set the standard.",
-]
-
-# 30 knight / honor / code motivation quotes
-KNIGHT_QUOTES = [
-    "A knight’s first armor is discipline; steel just covers the outside.",
-    "Honor is when your actions match your code, even when nobody’s watching.",
-    "The weak wait for the perfect moment; the knight sharpens his blade every day.",
-    "You do not rise to the occasion; you fall to the level of your training.",
-    "A code is not a slogan. It’s the rules you obey when it hurts.",
-    "The enemy is rarely out there. It’s the coward inside you.",
-    "A true knight keeps his word, his blade sharp, and his heart steady.",
-    "Every rep is a hammer blow on the armor of your character.",
-    "A man without a code is a sword without a wielder — dangerous, but pointless.",
-    "The day you stop training is the day your shield starts to crack.",
-    "Knighthood isn’t a title; it’s the weight of responsibility you choose to carry.",
-    "A warrior doesn’t hope for an easier path; he sharpens himself for the hard one.",
-    "Strength without honor is just intimidation. Honor without strength is just a wish.",
-    "Your past failures are dents in your armor, not reasons to stop fighting.",
-    "When the village sleeps, the knight keeps watch. When they doubt, he keeps training.",
-    "You don’t swear an oath once; you renew it with every hard choice.",
-    "Cowards break when it’s heavy. Knights grip tighter.",
-    "The code is simple: protect, improve, endure, repeat.",
-    "It’s not about winning one battle; it’s about being ready for all of them.",
-    "In the gym and in life, steel is tested in fire, not in comfort.",
-    "Your integrity is the sword you take into every room.",
-    "A knight respects the weight, but never fears it.",
-    "You can’t wear honor like a cloak; it’s carved into your bones by your choices.",
-    "The smallest promise to yourself is still sacred. Keep it.",
-    "You don’t have to be the strongest knight, just the one who never stops advancing.",
-    "Your code is written in your habits, not your words.",
-    "Any fool can lift when it’s easy. The knight lifts when it’s dark and cold.",
-    "You don’t need a crown. You need a standard you refuse to drop.",
-    "A real knight doesn’t seek comfort. He seeks capability.",
-    "Protect your people. Perfect your craft. Guard your mind. That is the path.",
-]
-
-# 30 fitness facts
-FITNESS_FACTS = [
-    "Fact: Consistent strength training 2–3 times per week can significantly increase muscle mass and bone density over time.",
-    "Fact: NEAT (non-exercise activity thermogenesis) — walking, fidgeting, stairs — can burn more calories per day than your actual workout.",
-    "Fact: Muscles don’t grow in the gym; they grow during rest and recovery, especially sleep.",
-    "Fact: Heavy compound lifts like squats and deadlifts stimulate more muscle and hormone response than machine-only workouts.",
-    "Fact: Cardio improves heart health but also helps with recovery by increasing blood flow to your muscles.",
-    "Fact: You can gain strength even in a calorie deficit, especially as a beginner.",
-    "Fact: DOMS (delayed onset muscle soreness) is not a perfect indicator of progress; you can grow without being wrecked every session.",
-    "Fact: Progressive overload — increasing weight, reps, or difficulty over time — is the core driver of muscle growth.",
-    "Fact: Flexibility and mobility work can reduce injury risk and actually improve strength performance.",
-    "Fact: Working out with friends or a group massively increases adherence and enjoyment.",
-    "Fact: Even 10–15 minutes of daily movement is better than zero and improves health markers.",
-    "Fact: HIIT (high-intensity interval training) can improve cardiovascular fitness with shorter time commitments.",
-    "Fact: Grip strength is correlated with overall health and longevity in many studies.",
-    "Fact: A strong posterior chain (back, glutes, hamstrings) helps posture, athleticism, and reduces back pain.",
-    "Fact: Consistent training changes not just your muscles, but your brain’s motor patterns and coordination.",
-    "Fact: Walking is one of the most underrated fat-loss tools — low stress, repeatable, and sustainable.",
-    "Fact: Lifting weights can improve insulin sensitivity and blood sugar control.",
-    "Fact: Balance and stability training reduce the risk of falls and injuries, especially as you age.",
-    "Fact: Even short “exercise snacks” (5 minutes of movement a few times a day) contribute to better health.",
-    "Fact: Muscle is metabolically active tissue; more muscle generally means a higher resting metabolic rate.",
-    "Fact: Training close to failure (with good form) is more important than fancy exercises for growth.",
-    "Fact: Good form under lighter weight beats ugly reps with ego weight every time.",
-    "Fact: Consistent training can reduce symptoms of anxiety and depression for many people.",
-    "Fact: Periodizing your training (cycles of intensity/volume) can prevent plateaus and burnout.",
-    "Fact: Strength training supports joint health by strengthening the muscles and tissues around them.",
-    "Fact: You can maintain most of your gains with far less volume than it took to build them.",
-    "Fact: Cardio and lifting together create better health outcomes than either alone for most people.",
-    "Fact: Training your core is about stability and bracing, not just endless crunches.",
-    "Fact: The best program is the one you can stick to consistently for months and years.",
-    "Fact: It’s never “too late” to start; people build strength and muscle well into their 60s and beyond.",
-]
-
-# 30 brain health facts
-BRAIN_FACTS = [
-    "Fact: Regular aerobic exercise increases blood flow to the brain and is linked to better memory and learning.",
-    "Fact: Quality sleep is when your brain consolidates memories and clears metabolic waste.",
-    "Fact: Chronic stress can physically shrink areas of the brain like the hippocampus if unmanaged.",
-    "Fact: Strength training has been associated with better cognitive function in older adults.",
-    "Fact: Learning new skills (languages, instruments, complex games) builds new neural connections.",
-    "Fact: Social connection is a powerful protector against cognitive decline and depression.",
-    "Fact: Omega-3 fatty acids (like DHA) are important structural components of brain cell membranes.",
-    "Fact: Dehydration as little as 1–2% can negatively affect focus, mood, and reaction time.",
-    "Fact: Excessive alcohol intake can damage brain cells and impair memory over time.",
-    "Fact: Meditation and mindfulness practices can change brain structure (like thickening the prefrontal cortex).",
-    "Fact: Regular physical exercise is one of the strongest lifestyle tools to reduce risk of dementia.",
-    "Fact: The brain uses about 20% of the body’s resting energy despite being only ~2% of body weight.",
-    "Fact: Good cardiovascular health is closely tied to brain health — what’s good for the heart is often good for the brain.",
-    "Fact: Chronic sleep deprivation impairs decision-making, reaction time, and emotional regulation.",
-    "Fact: Learning and exercising together (like complex sports) are especially powerful for brain health.",
-    "Fact: Vitamin B12 deficiency can lead to memory problems and neurological symptoms.",
-    "Fact: High-sugar diets over time may negatively affect cognitive function and mood.",
-    "Fact: Regular reading and mentally challenging activities help build cognitive reserve.",
-    "Fact: Exposure to nature and sunlight can improve mood and cognitive performance.",
-    "Fact: The brain is plastic — it can change structure and function throughout life with training and habit.",
-    "Fact: Resistance training can increase levels of brain-derived neurotrophic factor (BDNF), which supports neuron growth.",
-    "Fact: Poor mental health can show up as physical symptoms like fatigue and pain.",
-    "Fact: Good gut health may be linked to better brain health via the gut-brain axis.",
-    "Fact: Music training in childhood and adulthood is linked to better auditory and cognitive skills.",
-    "Fact: Multi-tasking is often just rapid task-switching; deep focus is more efficient for complex work.",
-    "Fact: Chronic exposure to screens late at night can interfere with melatonin and sleep quality.",
-    "Fact: Properly managed stress (e.g., through exercise and breathing) can build resilience, not just exhaustion.",
-    "Fact: Regular movement breaks during long work sessions improve attention and reduce mental fatigue.",
-    "Fact: Creative activities (drawing, writing, building) stimulate multiple regions of the brain at once.",
-    "Fact: A combination of diet, exercise, sleep, and social connection forms the foundation of long-term brain health.",
-]
-
-# 30 fitness nutrition / vitamin facts
-NUTRITION_FACTS = [
-    "Fact: Protein is the most satiating macronutrient and is crucial for muscle repair and growth.",
-    "Fact: Most lifters benefit from roughly 0.7–1.0 grams of protein per pound of bodyweight per day, depending on goals.",
-    "Fact: Creatine is one of the most researched supplements and is generally safe for healthy individuals.",
-    "Fact: Vitamin D deficiency is common and can affect mood, bone health, and immune function.",
-    "Fact: Magnesium plays a role in hundreds of enzymatic reactions, including muscle and nerve function.",
-    "Fact: Omega-3 fatty acids may support heart health, brain function, and help modulate inflammation.",
-    "Fact: Carbohydrates around workouts can support performance and recovery by replenishing glycogen.",
-    "Fact: Hydration affects strength, endurance, and cognitive performance — even mild dehydration hurts performance.",
-    "Fact: Fiber supports gut health, blood sugar control, and satiety; most people eat too little of it.",
-    "Fact: Whole foods tend to provide more micronutrients than highly processed foods with the same calories.",
-    "Fact: Chronic extreme calorie restriction can slow metabolism and lead to muscle loss.",
-    "Fact: A small calorie surplus plus resistance training is typically best for lean muscle gain.",
-    "Fact: A moderate calorie deficit, adequate protein, and lifting is best for fat loss with muscle retention.",
-    "Fact: Alcohol provides 7 calories per gram and can interfere with recovery and sleep quality.",
-    "Fact: Electrolytes like sodium, potassium, and magnesium are crucial for muscle contraction and nerve signaling.",
-    "Fact: Caffeine can improve performance and focus, but too much can hurt sleep and recovery.",
-    "Fact: Spreading protein intake across 3–4 meals may optimize muscle protein synthesis.",
-    "Fact: Vitamin C plays a key role in collagen formation, important for skin, joints, and connective tissue.",
-    "Fact: Calcium and vitamin D work together for bone health and strength.",
-    "Fact: Highly processed, hyper-palatable foods are engineered to override normal hunger signals.",
-    "Fact: Eating enough micronutrients (vitamins and minerals) supports hormone production and energy levels.",
-    "Fact: Meal timing matters less than total daily calories and macros for body composition, for most people.",
-    "Fact: Creatine might also support brain function and cognitive performance in addition to strength.",
-    "Fact: Consistent, balanced nutrition beats hardcore short-term diets over the long run.",
-    "Fact: A high-protein breakfast can reduce cravings and snacking later in the day.",
-    "Fact: Omega-3 and omega-6 fatty acid balance matters; many people consume too much omega-6.",
-    "Fact: Plant-based diets can support athletic performance if protein and key nutrients are planned well.",
-    "Fact: Vitamins and supplements are helpers, not substitutes for a solid diet.",
-    "Fact: Eating slowly and mindfully helps your brain register fullness more accurately.",
-    "Fact: Good nutrition is a performance multiplier in the gym, not just a way to change the scale.",
-]
-
-# 30 Reconquista-related facts (presented historically / informationally)
-RECONQUISTA_FACTS = [
-    "Fact: The Reconquista refers to the centuries-long process (roughly 8th to 15th century) in which Christian kingdoms in Iberia expanded southward over territories controlled by Muslim states.",
-    "Fact: The Muslim conquest of most of the Iberian Peninsula began around 711 CE, after the Battle of Guadalete.",
-    "Fact: One early Christian stronghold was the Kingdom of Asturias in the north, associated with the Battle of Covadonga (traditionally dated 722 CE).",
-    "Fact: Over time, northern Christian polities like Asturias evolved into later kingdoms such as León and Castile.",
-    "Fact: The Kingdom of Navarre was another important Christian realm during the medieval history of Iberia.",
-    "Fact: The Crown of Aragon, centered in the northeast, played a major role in Mediterranean politics and in later stages of the Reconquista.",
-    "Fact: Portugal emerged as an independent kingdom in the 12th century and completed its own territorial expansion southward by the mid-13th century.",
-    "Fact: The Almoravid and Almohad dynasties were powerful North African Muslim dynasties that ruled parts of Iberia and contested Christian advances.",
-    "Fact: The Battle of Las Navas de Tolosa in 1212 was a key victory for several Christian kingdoms against Almohad forces.",
-    "Fact: By the late 13th century, most of Iberia north of the Emirate of Granada was under Christian rule.",
-    "Fact: The Emirate of Granada remained the last major Muslim-ruled territory in Iberia into the 15th century.",
-    "Fact: The marriage of Ferdinand II of Aragon and Isabella I of Castile in the late 15th century unified two major Christian crowns.",
-    "Fact: The final campaign against the Emirate of Granada took place in the 1480s and early 1490s.",
-    "Fact: The capture of Granada in 1492 is often taken as a symbolic end point of the Reconquista.",
-    "Fact: The Alhambra in Granada is a famous palace-fortress complex built under Nasrid rule prior to the conquest.",
-    "Fact: Rodrigo Díaz de Vivar, known as ‘El Cid’, is a historical figure and later legendary hero in Castilian literature, connected to frontier warfare in Iberia.",
-    "Fact: The Reconquista period involved alliances and conflicts that were not always strictly along religious lines.",
-    "Fact: Frontier regions often had mixed populations with complex cultural, linguistic, and legal arrangements.",
-    "Fact: Military orders (such as the Order of Santiago or Calatrava) participated in campaigns during the Reconquista era.",
-    "Fact: Many medieval Iberian cities show layered architectural influences from Roman, Islamic, and Christian building traditions.",
-    "Fact: Legal codes like the ‘Siete Partidas’ in Castile were shaped during and after periods of expansion and consolidation.",
-    "Fact: The Reconquista era intersected with broader Mediterranean politics involving North Africa, France, and Italian states.",
-    "Fact: After 1492, the unified crowns of Castile and Aragon turned increasing attention to Atlantic exploration.",
-    "Fact: 1492 was also the year the Alhambra Decree ordered the expulsion of many Jews from the kingdoms of Castile and Aragon.",
-    "Fact: The term ‘Reconquista’ itself became more widely used and symbolically charged in later centuries.",
-    "Fact: Religious, political, and cultural narratives about the Reconquista have been interpreted differently over time by various groups.",
-    "Fact: Many modern Spanish towns and festivals still commemorate events or figures associated with medieval Iberian conflicts.",
-    "Fact: Scholarship on the period emphasizes both warfare and long-term cultural exchange across religious and linguistic boundaries.",
-    "Fact: The history of medieval Iberia is studied today for its complex interactions among Christian, Muslim, and Jewish communities.",
-    "Fact: Understanding the Reconquista involves examining both military events and the everyday lives of people on all sides of the frontier.",
-]
+# Quote/fact pools live in data/drops.json (one list per category) so they can
+# be edited without touching code; they're only read when the first drop is picked
+DROPS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "drops.json")
+
+
+@cache
+def all_drops() -> tuple[str, ...]:
+    """
+    Every quote/fact in one flat tuple, so a drop is a single uniform pick;
+    interned so repeated sends share one canonical string object.
+    """
+    with open(DROPS_PATH, encoding="utf-8") as f:
+        pools = json.load(f)
+    return tuple(map(sys.intern, itertools.chain.from_iterable(pools.values())))
+
+# Private generator for drops and member picks, bound once at import
+_rng = random.Random()
+_choice = _rng.choice
+
+# guild_id -> channel_id chosen by pick_general_channel; dropped whenever the
+# guild's channels or the bot's permissions change so the choice is redone
+GENERAL_CHANNEL_CACHE: dict[int, int] = {}
+# guild_id -> IDs of the text channels the bot may send messages in. A snapshot
+# of permissions_for(guild.me), refreshed by the guild/channel/role/member events below
+SENDABLE_CHANNEL_IDS: dict[int, set[int]] = {}
+
+
+def refresh_sendable_channels(guild: discord.Guild) -> set[int]:
+    sendable = {c.id for c in guild.text_channels if c.permissions_for(guild.me).send_messages}
+    SENDABLE_CHANNEL_IDS[guild.id] = sendable
+    GENERAL_CHANNEL_CACHE.pop(guild.id, None)
+    return sendable
+
+
+def track_sendable_channel(channel: discord.abc.GuildChannel):
+    sendable = SENDABLE_CHANNEL_IDS.get(channel.guild.id)
+    if sendable is None:
+        return
+    if isinstance(channel, discord.TextChannel) and channel.permissions_for(channel.guild.me).send_messages:
+        sendable.add(channel.id)
+    else:
+        sendable.discard(channel.id)
+
 
 def pick_general_channel(guild: discord.Guild) -> discord.abc.Messageable | None:
     """
@@ -1202,48 +1484,152 @@ def pick_general_channel(guild: discord.Guild) -> discord.abc.Messageable | None
     2) The system channel
     3) The first text channel the bot can send messages in
     """
-    # 1) Prefer #general
+    sendable = SENDABLE_CHANNEL_IDS.get(guild.id)
+    if sendable is None:
+        sendable = refresh_sendable_channels(guild)
+
+    channel_id = GENERAL_CHANNEL_CACHE.get(guild.id)
+    if channel_id in sendable:
+        channel = guild.get_channel(channel_id)
+        if channel is not None:
+            return channel
+
+    channel = _find_general_channel(guild, sendable)
+    if channel is not None:
+        GENERAL_CHANNEL_CACHE[guild.id] = channel.id
+    return channel
+
+
+def _find_general_channel(guild: discord.Guild, sendable: set[int]) -> discord.abc.Messageable | None:
+    # One pass: return #general if we can post there, remembering the first
+    # sendable channel as the last resort
+    first_sendable = None
     for channel in guild.text_channels:
-        if channel.name.lower() == "general" and channel.permissions_for(guild.me).send_messages:
+        if channel.id not in sendable:
+            continue
+        # 1) Prefer #general
+        if channel.name.lower() == "general":
             return channel
+        if first_sendable is None:
+            first_sendable = channel
 
     # 2) System channel
-    if guild.system_channel and guild.system_channel.permissions_for(guild.me).send_messages:
+    if guild.system_channel and guild.system_channel.id in sendable:
         return guild.system_channel
 
     # 3) First available text channel
+    return first_sendable
+
+
+def track_reminder_channel(channel: discord.abc.GuildChannel):
+    """
+    Add or drop `channel` in ALLOWED_CHANNEL_IDS based on its current name.
+    """
+    if isinstance(channel, discord.TextChannel) and channel.name.lower() in ALLOWED_REMINDER_CHANNELS:
+        ALLOWED_CHANNEL_IDS.add(channel.id)
+    else:
+        ALLOWED_CHANNEL_IDS.discard(channel.id)
+
+
+@bot.event
+async def on_guild_join(guild: discord.Guild):
+    refresh_sendable_channels(guild)
     for channel in guild.text_channels:
-        if channel.permissions_for(guild.me).send_messages:
-            return channel
+        track_reminder_channel(channel)
+
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    GENERAL_CHANNEL_CACHE.pop(channel.guild.id, None)
+    track_sendable_channel(channel)
+    track_reminder_channel(channel)
+
 
-    return None
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    GENERAL_CHANNEL_CACHE.pop(after.guild.id, None)
+    track_sendable_channel(after)
+    track_reminder_channel(after)
+
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    GENERAL_CHANNEL_CACHE.pop(channel.guild.id, None)
+    SENDABLE_CHANNEL_IDS.get(channel.guild.id, set()).discard(channel.id)
+    ALLOWED_CHANNEL_IDS.discard(channel.id)
+
+
+@bot.event
+async def on_guild_role_create(role: discord.Role):
+    refresh_sendable_channels(role.guild)
+
+
+@bot.event
+async def on_guild_role_update(before: discord.Role, after: discord.Role):
+    # Role permission changes can change where the bot may post
+    refresh_sendable_channels(after.guild)
+
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    # Channel overwrites for the deleted role no longer apply
+    refresh_sendable_channels(role.guild)
+
+
+@bot.event
+async def on_guild_update(before: discord.Guild, after: discord.Guild):
+    # A new system channel can change pick_general_channel's choice
+    refresh_sendable_channels(after)
+
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    # Only the bot's own role changes matter for the send snapshot
+    if after.id == after.guild.me.id:
+        refresh_sendable_channels(after.guild)
+
+
+# guild_id -> IDs of its human (non-bot) members, kept current by the member events below
+HUMANS_CACHE: dict[int, list[int]] = {}
+
+
+def refresh_humans_cache(guild: discord.Guild) -> list[int]:
+    ids = [m.id for m in guild.members if not m.bot]
+    HUMANS_CACHE[guild.id] = ids
+    return ids
 
 
 def pick_random_member(guild: discord.Guild) -> discord.Member | None:
     """
     Pick a random human member (no bots).
     """
-    humans = [m for m in guild.members if not m.bot]
-    if not humans:
+    ids = HUMANS_CACHE.get(guild.id)
+    if ids is None:
+        ids = refresh_humans_cache(guild)
+    if not ids:
         return None
-    return random.choice(humans)
+    return guild.get_member(_choice(ids))
+
+
+@bot.event
+async def on_member_join(member: discord.Member):
+    ids = HUMANS_CACHE.get(member.guild.id)
+    if ids is not None and not member.bot:
+        ids.append(member.id)
+
+
+@bot.event
+async def on_member_remove(member: discord.Member):
+    ids = HUMANS_CACHE.get(member.guild.id)
+    if ids is not None and member.id in ids:
+        ids.remove(member.id)
 
 
 def choose_random_drop() -> str:
     """
     Pick a random string from all categories.
     """
-    pools = [
-        GENERAL_QUOTES,
-        FITNESS_QUOTES,
-        KNIGHT_QUOTES,
-        FITNESS_FACTS,
-        BRAIN_FACTS,
-        NUTRITION_FACTS,
-        RECONQUISTA_FACTS,
-    ]
-    chosen_pool = random.choice(pools)
-    return random.choice(chosen_pool)
+    return _choice(all_drops())
 
 @tree.command(name="quote", description="Drop a random motivational quote or fact and tag someone to hype them up!")
 async def quote_command(interaction: discord.Interaction):
@@ -1270,36 +1656,90 @@ async def quote_command(interaction: discord.Interaction):
 # -----------------------
 
 DAILY_DROP_TIMES = [dt.time(hour=7, minute=0), dt.time(hour=16, minute=0)]
-DAILY_REMINDER_CACHE: dict[tuple[int, int], str] = {}
+
+# Messages the bot sends on its own (daily drops, reminders) go through this
+# queue; send_queue_worker sends at most one per SEND_INTERVAL seconds so a
+# broadcast to many guilds stays under Discord's rate limits
+SEND_INTERVAL = 0.25
+SEND_QUEUE: asyncio.Queue[tuple[discord.abc.GuildChannel, str]] = asyncio.Queue()
+
+
+# At most SEND_CONCURRENCY sends in flight at once; SEND_TASKS holds them so
+# the tasks aren't garbage-collected, and is bounded by the semaphore
+SEND_CONCURRENCY = 3
+SEND_SLOTS = asyncio.Semaphore(SEND_CONCURRENCY)
+SEND_TASKS: set[asyncio.Task] = set()
+
+
+async def send_one(channel: discord.abc.GuildChannel, content: str):
+    # Failures are per message, so one bad guild doesn't affect the rest
+    try:
+        await channel.send(content)
+    except Exception as e:
+        log.warning("Failed to send queued message in guild %s: %s", channel.guild.id, e)
+    finally:
+        SEND_SLOTS.release()
+
+
+async def send_queue_worker():
+    """
+    Drain SEND_QUEUE forever, starting at most one send per SEND_INTERVAL.
+    A plain loop rather than tasks.loop: that schedules relative to the last
+    run, so after a long idle wait it fires back to back until it catches up.
+    """
+    while True:
+        channel, content = await SEND_QUEUE.get()
+        try:
+            # Start the send without waiting for it, so a few HTTP round-trips
+            # overlap; the slot wait and the sleep still cap the send rate
+            await SEND_SLOTS.acquire()
+            task = asyncio.create_task(send_one(channel, content))
+            SEND_TASKS.add(task)
+            task.add_done_callback(SEND_TASKS.discard)
+        finally:
+            await asyncio.sleep(SEND_INTERVAL)
+
 
 @tasks.loop(time=DAILY_DROP_TIMES)
 async def daily_drops_task():
     # Runs twice per day at 7:00 and 16:00 (server local time)
-    print("Running daily_drops_task...")
+    log.info("Running daily_drops_task...")
+    # Every guild gets the same quote/fact this tick
+    content = choose_random_drop()
+    no_mention_msg = f"{content} 🏋️"
+
+    jobs = []
     for guild in bot.guilds:
         channel = pick_general_channel(guild)
         if channel is None:
             continue
 
         member = pick_random_member(guild)
-        content = choose_random_drop()
-
-        if member:
-            msg = f"{member.mention} {content} 🏋️"
-        else:
-            msg = f"{content} 🏋️"
+        msg = f"{member.mention} {no_mention_msg}" if member else no_mention_msg
+        jobs.append((channel, msg))
 
-        try:
-            await channel.send(msg)
-        except Exception as e:
-            print(f"Failed to send daily drop in guild {guild.id}: {e}")
+    for job in jobs:
+        await SEND_QUEUE.put(job)
 
 
 @daily_drops_task.before_loop
 async def before_daily_drops():
-    print("Waiting for bot to be ready before starting daily_drops_task...")
+    log.info("Waiting for bot to be ready before starting daily_drops_task...")
     await bot.wait_until_ready()
 
+
+REMINDER_TEMPLATE = (
+    "{mention} welcome back, warrior. 🛡️\n"
+    "Your total for **today** so far: **{total:.2f} pts**.\n"
+    "\n"
+    "Don’t forget to log your activities:\n"
+    "• `/checkin` for the full daily questionnaire\n"
+    "• `/log_lift`, `/log_run`, `/log_steps`, `/log_sleep`, `/log_protein`, etc.\n"
+    "\n"
+    "{leaderboard}"
+)
+
+
 @bot.event
 async def on_message(message: discord.Message):
     """
@@ -1317,58 +1757,76 @@ async def on_message(message: discord.Message):
     user = message.author
 
     # Only do this in certain channels (like #general or #fitness)
-    channel_name = message.channel.name.lower()
-    allowed_channels = {"general", "fitness", "gym", "fit-challenge"}
-
-    if channel_name not in allowed_channels:
+    if message.channel.id not in ALLOWED_CHANNEL_IDS:
         return
 
+    global REMINDER_DAY
     today = today_str()
+    if today != REMINDER_DAY:
+        REMINDER_DAY = today
+        REMINDED_TODAY.clear()
+        spawn_reminder_write(delete_reminders_before(today))
+
     key = (guild.id, user.id)
 
     # Already reminded this user today in this guild? Skip
-    if DAILY_REMINDER_CACHE.get(key) == today:
+    if key in REMINDED_TODAY:
         return
 
-    # Mark as reminded for today
-    DAILY_REMINDER_CACHE[key] = today
+    # Mark as reminded for today (persisted in the background)
+    REMINDED_TODAY.add(key)
+    spawn_reminder_write(mark_reminded(today, guild.id, user.id))
 
-    # Get this user's total and today's leaderboard
-    user_total = await daily_points_for_user(user.id, today)
-    rows = await today_leaderboard(limit=10)
+    # Get this user's total and today's leaderboard (independent, so run together)
+    user_total, rows = await asyncio.gather(
+        daily_points_for_user(user.id, today),
+        today_leaderboard(limit=10),
+    )
 
     # Build a quick scoreboard
     if rows:
-        lines = [f"📊 **Today’s scores ({today}):**"]
-        for rank, (u_id, username, total_pts) in enumerate(rows, start=1):
-            prefix = "👉" if u_id == user.id else f"{rank}."
-            lines.append(f"{prefix} `{username}` — **{total_pts:.2f} pts**")
-        leaderboard_text = "\n".join(lines)
+        leaderboard_text = f"📊 **Today’s scores ({today}):**\n" + "\n".join(
+            f"{'👉' if u_id == user.id else f'{rank}.'} `{username}` — **{total_pts:.2f} pts**"
+            for rank, (u_id, username, total_pts) in enumerate(rows, start=1)
+        )
     else:
         leaderboard_text = "No one has logged anything yet today. Be the first to start the grind. 💪"
 
     # Compose reminder message
-    msg_lines = [
-        f"{user.mention} welcome back, warrior. 🛡️",
-        f"Your total for **today** so far: **{user_total:.2f} pts**.",
-        "",
-        "Don’t forget to log your activities:",
-        "• `/checkin` for the full daily questionnaire",
-        "• `/log_lift`, `/log_run`, `/log_steps`, `/log_sleep`, `/log_protein`, etc.",
-        "",
-        leaderboard_text,
-    ]
+    msg = REMINDER_TEMPLATE.format(
+        mention=user.mention,
+        total=user_total,
+        leaderboard=leaderboard_text,
+    )
 
-    try:
-        await message.channel.send("\n".join(msg_lines))
-    except Exception as e:
-        print(f"Failed to send auto-reminder in guild {guild.id}: {e}")
+    await SEND_QUEUE.put((message.channel, msg))
 
 # -----------------------
 # RUN
 # -----------------------
 
+def setup_logging() -> logging.handlers.QueueListener:
+    """
+    Route the bot's log records through a queue so the event loop never blocks
+    on writing to the terminal; a background listener thread does the I/O.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, handler)
+
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    return listener
+
+
 if __name__ == "__main__":
     if not TOKEN:
         raise RuntimeError("DISCORD_TOKEN not set in .env")
-    bot.run(TOKEN)
+    log_listener = setup_logging()
+    try:
+        bot.run(TOKEN)
+    finally:
+        log_listener.stop()